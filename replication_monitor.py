@@ -9,7 +9,7 @@ the health and performance of PostgreSQL server replication.
 
 Example
 -------
-To use this module, ensure that psycopg2, tkinter, and matplotlib are installed, then run:
+To use this module, ensure that psycopg2, tkinter, numpy, and matplotlib are installed, then run:
 
     $ python postgresql_replication_monitor.py
 
@@ -28,32 +28,137 @@ MASTER_DB_CONFIG : dict
     Configuration dictionary for the master PostgreSQL database connection.
 SLAVE_DB_CONFIG : dict
     Configuration dictionary for the slave PostgreSQL database connection.
-replication_delays : collections.deque
-    A deque object used to store and update replication delay data.
+replication_delays : ReplicationRing
+    A circular buffer used to store and update replication delay data.
 
 Author : matthewpicone
 Date   : 03/12/2023
 """
-from collections import deque
+import queue
+import select
 
+import numpy as np
 import psycopg2
+import psycopg2.errorcodes
+import psycopg2.extensions
+from psycopg2.pool import ThreadedConnectionPool
 import tkinter as tk
 from threading import Thread
 import time
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import datetime
 import credentials
 
 # Configuration
 MASTER_DB_CONFIG = credentials.credentials.MASTER_DB_CONFIG
 SLAVE_DB_CONFIG = credentials.credentials.SLAVE_DB_CONFIG
 
-# Data storage for replication delay
-replication_delays = deque(maxlen=300)  # Set the maximum length to 300
+# TCP keepalive settings for the persistent connections, so a peer that vanishes without closing the socket is
+# detected by the kernel within seconds rather than after the default retransmission timeout
+KEEPALIVE_OPTIONS = {
+    "keepalives": 1,
+    "keepalives_idle": 5,
+    "keepalives_interval": 2,
+    "keepalives_count": 3,
+    "tcp_user_timeout": 10000,
+}
 
+# Connection pools, one per server. The poller holds a single asynchronous connection drawn from each pool and
+# reuses it for every poll; minconn is 0 so an unreachable server does not prevent the GUI from starting.
+master_pool = ThreadedConnectionPool(0, 2, async_=1, **KEEPALIVE_OPTIONS, **MASTER_DB_CONFIG)
+slave_pool = ThreadedConnectionPool(0, 2, async_=1, **KEEPALIVE_OPTIONS, **SLAVE_DB_CONFIG)
 
-def update_replication_data(is_in_recovery, replication_delay):
+
+class ReplicationRing:
+    """
+    Fixed-size circular buffer of replication delay samples.
+
+    The timestamps and delays are kept in two parallel float64 arrays rather than as a deque of
+    (datetime, timedelta) tuples, so the plot transform can be computed with vectorised NumPy operations.
+    Each array is twice the capacity and every sample is written to both halves, so the samples are always
+    available as one contiguous, chronologically ordered slice without copying.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of samples kept; the oldest sample is overwritten once it is reached.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of samples kept.
+    ts : numpy.ndarray
+        The sample timestamps, in monotonic clock seconds, mirrored across both halves.
+    dy : numpy.ndarray
+        The replication delays, in seconds, mirrored across both halves.
+    head : int
+        The index in the first half the next sample is written to.
+    size : int
+        The number of valid samples in the buffer.
+    """
+
+    def __init__(self, capacity=300):
+        self.capacity = capacity
+        self.ts = np.empty(2 * capacity, np.float64)
+        self.dy = np.empty(2 * capacity, np.float64)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, timestamp, delay):
+        """
+        Add a sample, overwriting the oldest one if the buffer is full.
+
+        Parameters
+        ----------
+        timestamp : float
+            The time the sample was taken, in monotonic clock seconds.
+        delay : float
+            The replication delay, in seconds.
+        """
+        self.ts[self.head] = self.ts[self.head + self.capacity] = timestamp
+        self.dy[self.head] = self.dy[self.head + self.capacity] = delay
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def arrays(self):
+        """
+        Return the valid samples in chronological order.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Views of the timestamps and delays, oldest first. They are overwritten by later appends.
+        """
+        end = self.head + self.capacity
+        return self.ts[end - self.size:end], self.dy[end - self.size:end]
+
+
+# Interval between polls, in seconds
+POLL_PERIOD = 1.0
+
+# Data storage for replication delay, holding the last 300 samples
+replication_delays = ReplicationRing(300)
+
+# Whether a plot refresh is already scheduled; new samples arriving before it runs are drawn by that refresh
+plot_pending = False
+
+# Maximum number of replicas listed individually in the master status
+MAX_LISTED_REPLICAS = 5
+
+# Upper bound on the delay between attempts against a failing server, in seconds
+MAX_BACKOFF = 30.0
+
+# Time an attempt, including connecting, may stay in flight before its connection is dropped, in seconds
+QUERY_TIMEOUT = 5.0
+
+# Raw results from the poller thread, applied to the GUI on the Tk main thread by drain_samples()
+sample_queue = queue.Queue()
+
+
+def update_replication_data(is_in_recovery, replication_delay, sampled_at):
     """
     Update the replication delay data.
 
@@ -61,76 +166,355 @@ def update_replication_data(is_in_recovery, replication_delay):
     ----------
     is_in_recovery : bool
         Indicates whether the slave database is in recovery mode.
-    replication_delay : datetime.timedelta
-        The time delay in replication from the master to the slave.
+    replication_delay : float or None
+        The time delay in replication from the master to the slave, in seconds.
+    sampled_at : float
+        The time the sample was taken, in monotonic clock seconds.
 
     Notes
     -----
-    This function appends the current timestamp and replication delay to the global deque.
-    It maintains a maximum length of 300 elements for the deque.
+    This function appends the sample timestamp and replication delay, in seconds, to the global ring buffer,
+    which keeps the last 300 samples, and schedules a plot refresh for when Tk is next idle unless one is
+    already pending, so a burst of samples is drawn once.
     """
-    global replication_delays
-    if replication_delay is not None and replication_delay != 0:
-        replication_delays.append((datetime.datetime.now(), replication_delay))
+    global plot_pending
+    replication_delays.append(sampled_at, replication_delay or 0.0)
+    if not plot_pending:
+        plot_pending = True
+        root.after_idle(update_plot)
 
-        if len(replication_delays) > 300:
-            replication_delays.popleft()
-    else:
-        replication_delays.append((datetime.datetime.now(), 0))
 
+def parse_slave_status(rows):
+    """
+    Extract the slave status from the query result.
 
-def check_master_status():
+    Parameters
+    ----------
+    rows : list of tuple
+        The single (pg_is_in_recovery, replication delay) row.
+
+    Returns
+    -------
+    tuple
+        The recovery mode, the replication delay in seconds, and the monotonic time the result arrived. The
+        timestamp is taken here rather than when the GUI picks the sample up so samples stay evenly spaced.
     """
-    Continuously check the replication status of the master database.
+    is_in_recovery, replication_delay = rows[0]
+    return is_in_recovery, replication_delay, time.monotonic()
 
-    This function establishes a connection to the master database, queries the
-    replication status, and updates the master status in the GUI.
-    In case of an error, it updates the GUI with the error information.
+
+def format_replication_status(rows):
     """
-    while True:
-        try:
-            with psycopg2.connect(**MASTER_DB_CONFIG) as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT * FROM pg_stat_replication;")
-                    replication_status = cur.fetchall()
-                    master_status.set(f"Master Replication Status:\n{replication_status}")
-                    master_status_color.set("green")
-                    master_status_indicator.itemconfig(master_status_rectangle, fill="green")
-        except Exception as e:
-            master_status.set(f"Error: {e}")
-            master_status_color.set("red")
-            master_status_indicator.itemconfig(master_status_rectangle, fill="red")
-        time.sleep(1)
+    Format the master replication status as a compact summary.
+
+    Parameters
+    ----------
+    rows : list of tuple
+        The (client_addr, state, write_lag, replay_lag) rows from pg_stat_replication.
+
+    Returns
+    -------
+    str
+        One line per replica, listing at most `MAX_LISTED_REPLICAS` replicas so the status label stays
+        the same size however many WAL senders the master has.
+    """
+    if not rows:
+        return "No replicas connected"
+
+    lines = [f"{addr} {state} w={write_lag} r={replay_lag}"
+             for addr, state, write_lag, replay_lag in rows[:MAX_LISTED_REPLICAS]]
+    if len(rows) > MAX_LISTED_REPLICAS:
+        lines.append(f"... and {len(rows) - MAX_LISTED_REPLICAS} more")
+    return "\n".join(lines)
 
 
-def check_slave_status():
+class StatusQuery:
     """
-    Continuously check the status and replication delay of the slave database.
+    A status query run asynchronously against one server.
+
+    The query owns a single persistent asynchronous connection drawn from its pool and is driven without
+    blocking by `poll_servers`, so one thread can wait on both servers at once. The query is prepared once per
+    connection and only executed by name afterwards, so the server does not parse and plan it on every poll.
+    Results and errors are queued for the GUI as (kind, ok, payload) tuples.
 
-    This function establishes a connection to the slave database, queries its
-    recovery status and replication delay, and updates the slave status in the GUI.
-    In case of an error, it updates the GUI with the error information.
+    Parameters
+    ----------
+    kind : str
+        The server the query runs against, either "master" or "slave".
+    pool : psycopg2.pool.AbstractConnectionPool
+        The pool the connection is drawn from. Its connections must be opened with ``async_=1``.
+    name : str
+        The name of the prepared statement.
+    sql : str
+        The status query.
+    parse : callable
+        Converts the fetched rows into the payload queued for the GUI.
+
+    Attributes
+    ----------
+    conn : psycopg2.extensions.connection or None
+        The persistent connection, or None until the next attempt to connect.
+    cursor : psycopg2.extensions.cursor or None
+        The cursor of the query in flight, or None when no query is running.
+    connecting : bool
+        Whether the connection is still being established.
+    preparing : bool
+        Whether the PREPARE statement is in flight.
+    prepared : bool
+        Whether the query has been prepared on the current connection.
+    state : int or None
+        The socket event being waited for, ``POLL_READ`` or ``POLL_WRITE``, or None when idle.
+    backoff : float
+        The delay before the next attempt after a failure, in seconds. Doubles on every consecutive failure up
+        to `MAX_BACKOFF` and resets after a success.
+    started_at : float
+        The poller tick, in monotonic clock seconds, the current attempt was started on. Attempts still in
+        flight `QUERY_TIMEOUT` seconds later are abandoned.
+    retry_at : float
+        The poller tick, in monotonic clock seconds, before which no new attempt is started.
     """
-    while True:
+
+    def __init__(self, kind, pool, name, sql, parse):
+        self.kind = kind
+        self.pool = pool
+        self.name = name
+        self.sql = sql
+        self.parse = parse
+        self.conn = None
+        self.cursor = None
+        self.connecting = False
+        self.preparing = False
+        self.prepared = False
+        self.state = None
+        self.backoff = 1.0
+        self.started_at = 0.0
+        self.retry_at = 0.0
+
+    def fileno(self):
+        return self.conn.fileno()
+
+    def start(self):
+        """
+        Connect if needed and send the query without waiting for the result.
+
+        Returns
+        -------
+        int or None
+            The socket event to wait for, or None if the result has already been queued.
+        """
+        if self.conn is None:
+            self.conn = self.pool.getconn()
+            self.connecting = True
+            self.prepared = False
+        else:
+            self.send()
+        return self.advance()
+
+    def send(self):
+        """
+        Send the PREPARE statement if the query is not prepared on this connection yet, otherwise execute it.
+        """
+        self.cursor = self.conn.cursor()
+        if self.prepared:
+            self.cursor.execute(f"EXECUTE {self.name};")
+        else:
+            self.preparing = True
+            self.cursor.execute(f"PREPARE {self.name} AS {self.sql}")
+
+    def advance(self):
+        """
+        Drive the connection attempt or query in flight as far as it can go without blocking.
+
+        Returns
+        -------
+        int or None
+            The socket event to wait for, or None once the result has been queued.
+        """
+        while True:
+            state = self.conn.poll()
+            if state != psycopg2.extensions.POLL_OK:
+                return state
+
+            if self.connecting:
+                self.connecting = False
+                self.send()
+            elif self.preparing:
+                self.preparing = False
+                self.prepared = True
+                self.cursor.close()
+                self.send()
+            else:
+                rows = self.cursor.fetchall()
+                self.cursor.close()
+                self.cursor = None
+                sample_queue.put((self.kind, True, self.parse(rows)))
+                self.backoff = 1.0
+                return None
+
+    def step(self, action):
+        """
+        Run `start` or `advance`, recording the socket event to wait for next.
+
+        Parameters
+        ----------
+        action : callable
+            The bound method to run.
+
+        Notes
+        -----
+        In case of an error, the error information is queued instead and the next attempt is delayed by the
+        current backoff, counted from the tick the failed attempt started on. The connection is only discarded,
+        so that a fresh one is opened on the next attempt, if it never finished connecting or the error closed
+        it; errors from the query itself leave the session in place. If the server no longer knows the prepared
+        statement, e.g. after ``DISCARD ALL`` or a pooler reset, it is prepared again on the next attempt.
+        """
         try:
-            with psycopg2.connect(**SLAVE_DB_CONFIG) as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT pg_is_in_recovery();")
-                    is_in_recovery = cur.fetchone()[0]
-                    cur.execute("SELECT now() - pg_last_xact_replay_timestamp() AS replication_delay;")
-                    replication_delay = cur.fetchone()[0]
-                    slave_status.set(f"Slave Recovery Mode: {is_in_recovery}\nReplication Delay: {replication_delay}")
-                    update_replication_data(is_in_recovery, replication_delay)
-                    slave_status_color.set("green")
-                    slave_status_indicator.itemconfig(slave_status_rectangle, fill="green")
+            self.state = action()
         except Exception as e:
-            slave_status.set(f"Error: {e}")
-            slave_status_color.set("red")
-            slave_status_indicator.itemconfig(slave_status_rectangle, fill="red")
-        time.sleep(1)
+            self.fail(e)
+
+    def fail(self, error, discard=False):
+        """
+        Abandon the current attempt and queue the error for the GUI.
+
+        Parameters
+        ----------
+        error : Exception
+            The error shown in the status label.
+        discard : bool
+            Whether to close the connection even if it still looks usable, e.g. when the server stopped
+            responding.
+        """
+        self.state = None
+        self.cursor = None
+        self.preparing = False
+        if getattr(error, "pgcode", None) == psycopg2.errorcodes.INVALID_SQL_STATEMENT_NAME:
+            self.prepared = False
+        self.retry_at = self.started_at + self.backoff
+        self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+        if self.conn is not None and (discard or self.connecting or self.conn.closed):
+            self.pool.putconn(self.conn, close=True)
+            self.conn = None
+            self.connecting = False
+        sample_queue.put((self.kind, False, error))
+
+
+master_query = StatusQuery("master", master_pool, "master_check",
+                           "SELECT client_addr, state, write_lag, replay_lag FROM pg_stat_replication;",
+                           format_replication_status)
+slave_query = StatusQuery("slave", slave_pool, "slave_check",
+                          "SELECT pg_is_in_recovery(), "
+                          "EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp()))::float8;",
+                          parse_slave_status)
+
+
+def poll_servers():
+    """
+    Continuously check the status of the master and slave databases from a single thread.
+
+    Every `POLL_PERIOD` seconds this function sends the status query to each server that is not still busy with
+    the previous one or backing off after a failure, then waits on both sockets with `select.select`, advancing
+    whichever is ready until both results are in or the next tick is due. Both queries therefore run concurrently
+    server-side.
 
+    An attempt that is still in flight `QUERY_TIMEOUT` seconds after it started, e.g. because the server vanished
+    without closing the socket, is abandoned and its connection closed, so the failure is reported and a fresh
+    connection is tried instead of waiting on the dead one.
 
-def plot_replication_delay(fig, ax):
+    Ticks are scheduled on a fixed `POLL_PERIOD` grid of the monotonic clock, so query latency does not stretch
+    the polling period. If the poller falls more than a tick behind, the grid restarts from the current time rather
+    than firing the missed ticks back to back.
+    """
+    queries = (master_query, slave_query)
+    next_tick = time.monotonic()
+    while True:
+        for query in queries:
+            if query.state is not None and next_tick - query.started_at >= QUERY_TIMEOUT:
+                query.fail(TimeoutError(f"No response within {QUERY_TIMEOUT:.0f} s"), discard=True)
+            # Ticks and retry times are both on the tick grid; the tolerance absorbs float rounding
+            if query.state is None and next_tick + POLL_PERIOD / 2 >= query.retry_at:
+                query.started_at = next_tick
+                query.step(query.start)
+
+        next_tick += POLL_PERIOD
+        while True:
+            readers = [query for query in queries if query.state == psycopg2.extensions.POLL_READ]
+            writers = [query for query in queries if query.state == psycopg2.extensions.POLL_WRITE]
+            timeout = next_tick - time.monotonic()
+            if (not readers and not writers) or timeout <= 0:
+                break
+
+            ready_readers, ready_writers, _ = select.select(readers, writers, [], timeout)
+            for query in ready_readers + ready_writers:
+                query.step(query.advance)
+
+        now = time.monotonic()
+        if now > next_tick + POLL_PERIOD:
+            next_tick = now
+        time.sleep(max(0.0, next_tick - now))
+
+
+def show_status(status, indicator, text, color):
+    """
+    Update a status label and its indicator.
+
+    Parameters
+    ----------
+    status : tkinter.StringVar
+        The variable shown by the status label.
+    indicator : tkinter.Label
+        The indicator square next to the server title.
+    text : str
+        The status text.
+    color : str
+        The indicator colour.
+
+    Notes
+    -----
+    Setting a StringVar makes Tk re-layout its label even if the text is the same, so the widgets are only
+    updated when the text or colour actually changed, e.g. not while the same error repeats.
+    """
+    if status.get() != text:
+        status.set(text)
+    if indicator.cget("bg") != color:
+        indicator.config(bg=color)
+
+
+def drain_samples():
+    """
+    Apply the results queued by the poller thread to the GUI.
+
+    Notes
+    -----
+    Tk widgets may only be touched from the thread running the main loop, so the poller never updates the GUI
+    directly. This function runs on the Tk main thread, empties the queue, updates the status widgets and the
+    replication delay data, and reschedules itself every 200 ms.
+    """
+    while True:
+        try:
+            kind, ok, payload = sample_queue.get_nowait()
+        except queue.Empty:
+            break
+
+        if kind == "master":
+            if ok:
+                show_status(master_status, master_status_indicator, f"Master Replication Status:\n{payload}", "green")
+            else:
+                show_status(master_status, master_status_indicator, f"Error: {payload}", "red")
+        else:
+            if ok:
+                is_in_recovery, replication_delay, sampled_at = payload
+                delay_text = "Unknown" if replication_delay is None else f"{replication_delay:.3f} s"
+                show_status(slave_status, slave_status_indicator,
+                            f"Slave Recovery Mode: {is_in_recovery}\nReplication Delay: {delay_text}", "green")
+                update_replication_data(is_in_recovery, replication_delay, sampled_at)
+            else:
+                show_status(slave_status, slave_status_indicator, f"Error: {payload}", "red")
+
+    root.after(200, drain_samples)
+
+
+def plot_replication_delay(fig, ax, line):
     """
     Plot the replication delay on a given matplotlib figure and axis.
 
@@ -140,31 +524,74 @@ def plot_replication_delay(fig, ax):
         The matplotlib figure object.
     ax : matplotlib.axes.Axes
         The matplotlib axis object on which to plot the data.
+    line : matplotlib.lines.Line2D
+        The persistent line artist holding the replication delay data.
+
+    Returns
+    -------
+    bool
+        True if the y axis limits changed and the whole canvas has to be redrawn.
 
     Notes
     -----
-    This function plots the replication delays stored in the global deque, displaying
-    the time in seconds against the replication delay.
+    This function updates the line with the replication delays stored in the global ring buffer, displaying
+    the time in seconds against the replication delay. The x axis is fixed to the span of a full ring buffer, and
+    the y axis is only rescaled when the data leaves its limits or uses less than a quarter of them, so most
+    refreshes can blit the line over the cached background. When there are more samples than the axis is
+    pixels wide, only every n-th sample is plotted, counting back from the most recent one so it is always shown.
     """
-    ax.clear()
-    x_vals, y_vals = zip(*replication_delays) if replication_delays else ([], [])
-    x_vals = [(x_vals[-1] - x).total_seconds() for x in x_vals]
-    x_vals = [x_vals[-1] - x for x in x_vals]
+    ts, dy = replication_delays.arrays()
+    if not len(ts):
+        line.set_data(ts, dy)
+        return False
+    # Limits come from every sample so a spike between decimated points still rescales the axis
+    y_min, y_max = min(0.0, float(dy.min())), float(dy.max())
+
+    stride = max(1, len(ts) // max(1, int(ax.bbox.width)))
+    if stride > 1:
+        ts, dy = ts[::-stride][::-1], dy[::-stride][::-1]
+    line.set_data(ts - ts[-1], dy)
 
-    ax.plot(x_vals, y_vals, '-', color='blue')
-    ax.set_title("Replication Delay Over Last 30 Minutes")
-    ax.set_xlabel("Time (seconds past)")
-    ax.set_ylabel("Replication Delay (seconds)")
+    low, high = ax.get_ylim()
+    if y_min < low or y_max > high or (high > 1.0 and y_max < high / 4):
+        ax.set_ylim(1.5 * y_min, max(1.5 * y_max, 1.0))
+        return True
+    return False
 
 
 def refresh_plot():
     """
     Refresh the replication delay plot.
 
-    This function updates the plot with the latest replication delay data.
+    This function updates the plot with the latest replication delay data. When the axis limits are unchanged
+    only the line is redrawn over the cached background; otherwise the whole canvas is redrawn, which also
+    refreshes the cached background through `on_draw`.
+    """
+    if plot_replication_delay(fig, ax, line) or plot_background is None:
+        canvas.draw()
+    else:
+        canvas.restore_region(plot_background)
+        ax.draw_artist(line)
+        canvas.blit(ax.bbox)
+
+
+def on_draw(event):
+    """
+    Cache the plot background after a full canvas redraw.
+
+    Parameters
+    ----------
+    event : matplotlib.backend_bases.DrawEvent
+        The draw event emitted by the canvas.
+
+    Notes
+    -----
+    The line is animated and therefore excluded from full redraws, so it is drawn here on top of the freshly
+    cached background.
     """
-    plot_replication_delay(fig, ax)
-    canvas.draw()
+    global plot_background
+    plot_background = canvas.copy_from_bbox(ax.bbox)
+    ax.draw_artist(line)
 
 
 # Set up the Tkinter window
@@ -179,10 +606,6 @@ root.rowconfigure(1, weight=1)
 master_status = tk.StringVar(root, value="Checking Master Status...")
 slave_status = tk.StringVar(root, value="Checking Slave Status...")
 
-# Indicator colors
-master_status_color = tk.StringVar(root, value="gray")  # Default color is gray
-slave_status_color = tk.StringVar(root, value="gray")  # Default color is gray
-
 # Create frames for better layout
 master_frame = tk.Frame(root, padx=10, pady=10)
 master_frame.grid(row=0, column=0, rowspan=2, columnspan=2, sticky="nsew")
@@ -197,14 +620,10 @@ plot_frame.grid(row=2, column=0, columnspan=4, sticky="nsew")
 master_label_title = tk.Label(master_frame, text=f"Master {MASTER_DB_CONFIG['host']}", font=("Helvetica", 14))
 master_label_title.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="w")
 
-# Create a small canvas for the indicator square
-master_status_indicator = tk.Canvas(master_frame, width=15, height=15)
+# Create a small coloured label for the indicator square, gray until the first status arrives
+master_status_indicator = tk.Label(master_frame, width=2, height=1, bg="gray", relief=tk.SOLID, borderwidth=1)
 master_status_indicator.grid(row=0, column=1, padx=(0, 10), pady=(10, 0), sticky="e")
 
-# Create a rectangle on the canvas for the indicator
-master_status_rectangle = master_status_indicator.create_rectangle(0, 0, 15, 15, fill=master_status_color.get())
-master_status_indicator.itemconfig(master_status_rectangle, fill=master_status_color.get())  # Set initial color
-
 master_label = tk.Label(master_frame, textvariable=master_status, justify=tk.LEFT, wraplength=480, relief=tk.SUNKEN,
                         bg="white", anchor='w')
 master_label.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
@@ -212,36 +631,46 @@ master_label.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew"
 slave_label_title = tk.Label(slave_frame, text=f"Slave {SLAVE_DB_CONFIG['host']}", font=("Helvetica", 14))
 slave_label_title.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="w")
 
-# Create a small canvas for the indicator square
-slave_status_indicator = tk.Canvas(slave_frame, width=15, height=15)
+# Create a small coloured label for the indicator square, gray until the first status arrives
+slave_status_indicator = tk.Label(slave_frame, width=2, height=1, bg="gray", relief=tk.SOLID, borderwidth=1)
 slave_status_indicator.grid(row=0, column=1, padx=(0, 10), pady=(10, 0), sticky="e")
 
-# Create a rectangle on the canvas for the indicator
-slave_status_rectangle = slave_status_indicator.create_rectangle(0, 0, 15, 15, fill=slave_status_color.get())
-slave_status_indicator.itemconfig(slave_status_rectangle, fill=slave_status_color.get())  # Set initial color
-
 slave_label = tk.Label(slave_frame, textvariable=slave_status, justify=tk.LEFT, wraplength=480, relief=tk.SUNKEN,
                        bg="white", anchor='w')
 slave_label.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
 
 # Matplotlib plot setup with padding
-fig, ax = plt.subplots()
+fig = Figure(figsize=(5, 3))
+ax = fig.add_subplot(111)
+# The x axis spans a full ring buffer at one sample per poll. Samples are spaced further apart while a server is
+# backing off or after the poll grid re-anchors, so the oldest samples in the buffer can then fall off the left edge.
+history_seconds = replication_delays.capacity * POLL_PERIOD
+ax.set_title(f"Replication Delay Over Last {history_seconds:.0f} Seconds")
+ax.set_xlabel("Time (seconds past)")
+ax.set_ylabel("Replication Delay (seconds)")
+ax.set_xlim(-history_seconds, 0)
+ax.set_ylim(0, 1.0)
+(line,) = ax.plot([], [], '-', color='blue', animated=True)
 
 canvas = FigureCanvasTkAgg(fig, master=plot_frame)
 canvas_widget = canvas.get_tk_widget()
 canvas_widget.grid(row=0, column=0, sticky="nsew")
 
+# Background behind the line, re-captured whenever the canvas is fully redrawn (limit changes, resizes)
+plot_background = None
+canvas.mpl_connect('draw_event', on_draw)
+
 
 def update_plot():
+    global plot_pending
+    plot_pending = False
     refresh_plot()
-    root.after(1000, update_plot)  # Refresh every 60 seconds
 
 
-update_plot()
+drain_samples()
 
-# Start threads for monitoring
-Thread(target=check_master_status, daemon=True).start()
-Thread(target=check_slave_status, daemon=True).start()
+# Start the thread for monitoring
+Thread(target=poll_servers, daemon=True).start()
 
 # Start the Tkinter event loop
 root.mainloop()
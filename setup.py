@@ -3,7 +3,8 @@ from setuptools import setup
 setup(
     name='cluster_guard',
     version='1.0.0',
-    packages=[''],
+    py_modules=['replication_monitor'],
+    install_requires=['psycopg2-binary', 'numpy', 'matplotlib'],
     url='matthewpicone.com',
     license='MIT',
     author='Matthew Picone',